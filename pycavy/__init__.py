@@ -57,5 +57,42 @@ optional `opt` argument for optimization level, which may be 0, 1, 2, or 3.
 
 import pycavy.dependencies as deps
 
-# The contents of the native extension
-from .pycavy import *
+# The contents of the native extension are loaded on first attribute access
+# (PEP 562), so that `import pycavy` doesn't pay for loading it up front. This
+# is the package's public interface: `deps`, followed by the names exported by
+# the `pycavy` pymodule in `src/lib.rs`, which are forwarded to the extension.
+# Keep the two in sync when adding to the pymodule.
+__all__ = [
+    'deps',
+    'Session',
+    'Gate',
+    'HGate',
+    'ZGate',
+    'XGate',
+    'TGate',
+    'CXGate',
+    'CavyError',
+    '__version__',
+]
+
+_ext = None
+
+
+def _load_ext():
+    global _ext
+    if _ext is None:
+        from importlib import import_module
+        _ext = import_module('.pycavy', __name__)
+    return _ext
+
+
+def __getattr__(name):
+    if name == 'pycavy':
+        return _load_ext()
+    if name in __all__:
+        return getattr(_load_ext(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,6 +10,7 @@ import importlib
 from dataclasses import dataclass
 from enum import Enum
 from functools import wraps
+from types import MappingProxyType
 from typing import Any, Callable, Optional
 
 
@@ -20,7 +21,7 @@ class DependencyKind(Enum):
     UNSATISFIABLE = 'unsatisfiable'
 
 
-@dataclass
+@dataclass(frozen=True)
 class DependencySpec():
     """A simple wrapper around the pieces of data required to describe an optional
     dependency.
@@ -31,8 +32,10 @@ class DependencySpec():
     desc: str
 
 
-# The following specs are all the dependencies used anywhere in the PyCavy system.
-DEPENDENCIES = {
+# The following specs are all the dependencies used anywhere in the PyCavy
+# system. The catalogue is fixed at import time, so neither the mapping nor the
+# specs in it can be changed.
+DEPENDENCIES = MappingProxyType({
     'cirq': DependencySpec(
         name='cirq',
         kind=DependencyKind.PYTHON_PKG,
@@ -71,7 +74,7 @@ DEPENDENCIES = {
         url=None,
         desc="""A dependency that always fails to load"""
     ),
-}
+})
 
 LOADED_DEPENDENCIES = set()
 
@@ -116,17 +119,23 @@ def dependency_version(dep: str) -> str:
 
 def require(*deps: str) -> Callable:
     """Annotation for a function that requires one or more dependencies. These
-    dependencies are lazy-loaded on first use.
+    dependencies are lazy-loaded on first use; after that, the wrapper forwards
+    straight to the annotated function without checking them again.
     """
     def require_dep(fn: Callable) -> Callable:
+        loaded = False
+
         @wraps(fn)
         def wrapped(*args, **kwargs) -> Any:
-            for dep in deps:
-                if dep not in LOADED_DEPENDENCIES:
-                    try:
-                        load_dependency(dep)
-                    except ModuleNotFoundError:
-                        raise MissingDependencyError(dep)
+            nonlocal loaded
+            if not loaded:
+                for dep in deps:
+                    if dep not in LOADED_DEPENDENCIES:
+                        try:
+                            load_dependency(dep)
+                        except ModuleNotFoundError:
+                            raise MissingDependencyError(dep)
+                loaded = True
             return fn(*args, **kwargs)
         return wrapped
     return require_dep
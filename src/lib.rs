@@ -154,13 +154,31 @@ fn opt_flag(input: Option<bool>) -> i8 {
     }
 }
 
+/// A Cavy compilation session, whose constructor accepts compiler options to
+/// customize device architecture and code generation behavior.
+///
+/// If `cache_size` is positive, the session remembers the circuits for the last
+/// `cache_size` distinct sources it compiled, and returns them again without
+/// rerunning the compiler. A repeated compilation then returns the *same* gate
+/// objects as the earlier one, rather than new ones. Caching is off by default,
+/// and is always off when `debug` is set, so that every compilation produces
+/// its debug output. `clear_cache` empties the cache.
 #[pyclass]
 struct Session {
     conf: Config,
+    /// Recently compiled circuits, keyed by their source, with the most
+    /// recently used entry last. The configuration can't change after
+    /// construction, so a source string always compiles to the same circuit.
+    ///
+    /// A cache hit hands back the *same* gate objects as the earlier result.
+    /// That's only sound because the gate classes have no `__dict__` and only
+    /// expose getters: if they ever gain a setter (e.g. `#[pyo3(set)]` on
+    /// `qbs`), this cache must start copying them.
+    cache: Vec<(String, Vec<PyObject>)>,
+    /// The maximum number of cached circuits; 0 disables caching.
+    cache_size: usize,
 }
 
-/// A Cavy compilation session, whose constructor accepts compiler options to
-/// customize device architecture and code generation behavior.
 #[pymethods]
 impl Session {
     #[new]
@@ -173,7 +191,8 @@ impl Session {
         meas_mode = "\"nondemolition\"",
         feedback = "false",
         recursion = "false",
-        phase = "None"
+        phase = "None",
+        cache_size = "0"
     )]
     fn new(
         opt_level: u8,
@@ -186,6 +205,7 @@ impl Session {
         feedback: bool,
         recursion: bool,
         phase: Option<&str>,
+        cache_size: usize,
     ) -> Self {
         let phase_config = get_phase(phase);
         let meas_mode = get_meas_mode(meas_mode).unwrap();
@@ -208,16 +228,46 @@ impl Session {
             opt,
             phase_config,
         };
-        Self { conf }
+        Self {
+            conf,
+            cache: Vec::new(),
+            cache_size,
+        }
     }
 
-    fn compile<'a>(&self, py: Python<'a>, src: String) -> PyResult<Vec<&'a PyAny>> {
+    fn compile<'a>(&mut self, py: Python<'a>, src: String) -> PyResult<Vec<&'a PyAny>> {
+        let use_cache = self.cache_size > 0 && !self.conf.debug;
+        if use_cache {
+            if let Some(idx) = self.cache.iter().position(|(key, _)| *key == src) {
+                let entry = self.cache.remove(idx);
+                let gates = entry
+                    .1
+                    .iter()
+                    .map(|gate| gate.clone_ref(py).into_ref(py))
+                    .collect();
+                self.cache.push(entry);
+                return Ok(gates);
+            }
+        }
+
         let mut stats = Statistics::new();
         let mut ctx = Context::new(&self.conf, &mut stats);
 
-        match self.compile_inner(&mut ctx, src) {
-            Ok(Some(circ)) => circuit_to_py(py, circ),
-            Ok(None) => Ok(vec![]),
+        match self.compile_inner(&mut ctx, &src) {
+            Ok(circ) => {
+                let gates = match circ {
+                    Some(circ) => circuit_to_py(py, circ)?,
+                    None => vec![],
+                };
+                if use_cache {
+                    if self.cache.len() >= self.cache_size {
+                        self.cache.remove(0);
+                    }
+                    let cached = gates.iter().map(|&gate| gate.into()).collect();
+                    self.cache.push((src, cached));
+                }
+                Ok(gates)
+            }
             Err(errs) => {
                 let errs = format!("{}", errs.fmt_with(&ctx));
                 let py_err = PyErr::new::<CavyError, _>(errs);
@@ -225,15 +275,16 @@ impl Session {
             }
         }
     }
+
+    /// Forget all the circuits cached by this session
+    fn clear_cache(&mut self) {
+        self.cache.clear();
+    }
 }
 
 impl Session {
-    fn compile_inner(
-        &self,
-        ctx: &mut Context,
-        src: String,
-    ) -> Result<Option<CircuitBuf>, ErrorBuf> {
-        let id = ctx.srcs.insert_input(&src);
+    fn compile_inner(&self, ctx: &mut Context, src: &str) -> Result<Option<CircuitBuf>, ErrorBuf> {
+        let id = ctx.srcs.insert_input(src);
         cavy::compile::compile_circuit(id, ctx)
     }
 }